@@ -1,6 +1,7 @@
 import argparse
 import asyncio
-from .core import ListenAndSend, Arbitrage
+import logging
+import sys
 
 def main() -> None:
     parser = argparse.ArgumentParser(prog='Blockcahin RPC Simulation', description='Transaction Simulations for Swap and Send')
@@ -16,14 +17,19 @@ def main() -> None:
     arbitrage_parser.add_argument("--retries", type=int, required=False, default=5, help="Retries for Web3 connection and sending transaction")
     
     args = parser.parse_args()
+    logging.basicConfig(format="%(message)s", handlers=[logging.StreamHandler(sys.stdout)])
+    logging.getLogger("blockchain_rpc").setLevel(logging.INFO)
     
     if args.command == "listenAndSend":
+        from .core import ListenAndSend
+
         program = ListenAndSend(amount=args.amount, num_blocks=args.blocks, retries=args.retries)
-        program.execute()
+        asyncio.run(program.execute())
     elif args.command == "arbitrage":
-        loop = asyncio.get_event_loop()
-        program = Arbitrage(amount=args.amount, retries=args.retries, loop=loop)
-        loop.run_until_complete(program.execute())
+        from .core import Arbitrage
+
+        program = Arbitrage(amount=args.amount, retries=args.retries)
+        asyncio.run(program.execute())
     else:
         parser.print_help()
 
@@ -1,4 +1,6 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -6,6 +8,13 @@ from .utils import validate_directory
 from .models import ABI
 from .errors import ABIException
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+_MAX_READ_WORKERS = 8
+
 class ABILoader:
     """
     Responsible for loading in and lending out available ABIs.
@@ -16,14 +25,22 @@ class ABILoader:
         Optional Path to directory for ABIs.
     _abis: :class:`Dict[str, Any]`
         The ABIs loaded in as a python dictionary.
+    _CACHE: :class:`Dict[Path, Dict[str, Any]]`
+        ABIs already parsed, keyed by resolved directory. Shared by all 
+        instances so each directory is only read from disk once.
     """
+    _CACHE: Dict[Path, Dict[str, Any]] = {}
+
     def __init__(
         self, 
         abi_directory: Optional[Path] = Path('./blockchain_rpc/abi')
     ):
         self._abi_dir: Path = validate_directory(abi_directory)
-        self._abis: Dict[str, Any] = {}
-        self._load_abis()
+
+        cache_key = self._abi_dir.resolve()
+        if cache_key not in ABILoader._CACHE:
+            ABILoader._CACHE[cache_key] = self._load_abis()
+        self._abis: Dict[str, Any] = ABILoader._CACHE[cache_key]
 
     def get_abi(
         self,
@@ -36,13 +53,20 @@ class ABILoader:
         except KeyError as e:
             raise ABIException("ABI does not exist")
 
-    def _load_abis(self) -> None:
-        for file in self._abi_dir.glob('*.json'):
-            name = file.stem
+    def _load_abis(self) -> Dict[str, Any]:
+        abis: Dict[str, Any] = {}
+        with os.scandir(self._abi_dir) as entries:
+            files = [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+
+        with ThreadPoolExecutor(max_workers=_MAX_READ_WORKERS) as executor:
+            reads = {entry: executor.submit(Path(entry.path).read_bytes) for entry in files}
+
+        for entry, read in reads.items():
+            name = entry.name[:-len('.json')]
             try:
-                with file.open() as f:
-                    self._abis[name] = json.load(f)
+                abis[name] = json_loads(read.result())
             except (FileNotFoundError, json.JSONDecodeError) as e:
-                print(f"Error reading from {self._abi_dir} for {file}: {e}")
-        if not self._abis:
+                print(f"Error reading from {self._abi_dir} for {entry.name}: {e}")
+        if not abis:
             print("No ABIs found")
+        return abis
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+from hexbytes import HexBytes
+
+from .config import PRIVATE_KEY
+from .errors import Web3ConnectionException, TransactionException
+from .models import GasFees, TransactionStatus, TransactionResult
+from .utils import address_to_bytes
+from .node_common import (
+    REQUEST_TIMEOUT,
+    GAS_FEE_TTL,
+    NonceState,
+    needs_gas_fees,
+    validate_transaction_data,
+    sign_transaction,
+    is_underpriced_error,
+    is_nonce_error,
+    connect_delay,
+    load_account,
+    ether_to_wei
+)
+
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+    from eth_typing import ChecksumAddress
+    from web3 import AsyncWeb3
+    from web3.types import TxParams
+
+logger = logging.getLogger(__name__)
+
+class AsyncWeb3Node:
+    """
+    Async counterpart of Web3Node built on AsyncWeb3, so one event loop can
+    keep many transactions in flight.
+
+    Must be connected before use, either with ``await node.connect()`` or
+    ``async with AsyncWeb3Node(...) as node``.
+
+    Attributes
+    ------------
+    _private_key: :class:`str`
+        Private key for account on blockchain.
+    rpc_endpoint: :class:`str`
+        URL for rpc endpoint.
+    retries: :class:`int`
+        Optional number of retries for reconnecting to Web3.
+    poll_latency: :class:`float`
+        Optional seconds between receipt polls while verifying.
+    _web3: :class:`AsyncWeb3`
+        AsyncWeb3 instance responsible for connecting and sending.
+    _local_account: :class:`LocalAccount`
+        Account derived from the private key once, used for signing.
+    _account_address: :class:`ChecksumAddress`
+        Public address of account.
+    _chain_id: :class:`int`
+        Chain id of the endpoint, fetched once on connect.
+    _nonce_state: :class:`NonceState`
+        Local nonce of the account. Reserved without awaiting in between,
+        so concurrent sends on the loop get contiguous nonces.
+    _gas_fee_cache: :class:`Tuple[float, GasFees]`
+        Monotonic time of the last gas fee fetch and its result, reused
+        for GAS_FEE_TTL seconds.
+    _gas_fee_fetch: :class:`asyncio.Task`
+        Gas fee fetch in flight, awaited by every caller that misses the
+        cache meanwhile.
+    _nonce_sync_lock: :class:`asyncio.Lock`
+        Serializes nonce re-syncs, which await the node in between.
+    """
+    _private_key = PRIVATE_KEY
+
+    def __init__(
+        self,
+        rpc_endpoint: str,
+        retries: Optional[int] = 5,
+        poll_latency: Optional[float] = 1.0,
+    ):
+        self.rpc_endpoint: str = rpc_endpoint
+        self.retries: Optional[int] = retries
+        self.poll_latency: Optional[float] = poll_latency
+
+        self._web3: Optional[AsyncWeb3] = None
+        self._local_account: Optional[LocalAccount] = None
+        self._account_address: Optional[ChecksumAddress] = None
+        self._chain_id: Optional[int] = None
+        self._nonce_state = NonceState()
+        self._gas_fee_cache: Optional[Tuple[float, GasFees]] = None
+        self._gas_fee_fetch: Optional[asyncio.Task] = None
+        self._nonce_sync_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> AsyncWeb3Node:
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def connect(self) -> AsyncWeb3Node:
+        # __aexit__ does not run when __aenter__ fails, so a failed connect
+        # disconnects the provider itself
+        try:
+            await self._initialize_web3()
+            self._local_account = load_account(self._private_key)
+            self._account_address = self._local_account.address
+
+            self._chain_id, pending = await asyncio.gather(
+                self._web3.eth.chain_id,
+                self._web3.eth.get_transaction_count(self._account_address, 'pending'),
+            )
+        except BaseException:
+            await self.close()
+            raise
+        self._nonce_state.sync(pending)
+        return self
+
+    async def close(self) -> None:
+        if self._web3 is not None:
+            web3, self._web3 = self._web3, None
+            await web3.provider.disconnect()
+
+    async def get_gas_fees(
+        self
+    ) -> GasFees:
+        if self._gas_fee_cache is not None:
+            fetched_at, gas_fees = self._gas_fee_cache
+            if time.monotonic() - fetched_at < GAS_FEE_TTL:
+                return gas_fees
+
+        if self._gas_fee_fetch is None or self._gas_fee_fetch.done():
+            self._gas_fee_fetch = asyncio.ensure_future(self._fetch_gas_fees())
+        return await asyncio.shield(self._gas_fee_fetch)
+
+    async def _fetch_gas_fees(
+        self
+    ) -> GasFees:
+        fee_history, maxPriorityFeePerGas = await asyncio.gather(
+            self._web3.eth.fee_history(1, 'latest'),
+            self._web3.eth.max_priority_fee,
+        )
+        maxFeePerGas = (2 * fee_history['baseFeePerGas'][-1]) + maxPriorityFeePerGas
+
+        gas_fees = GasFees(maxPriorityFeePerGas, maxFeePerGas)
+        self._gas_fee_cache = (time.monotonic(), gas_fees)
+        return gas_fees
+
+    async def send_ETH(
+        self,
+        amount: float,
+        to_address: str,
+    ) -> TransactionResult:
+        return await self.send_ETH_wei(ether_to_wei(amount), to_address)
+
+    async def send_ETH_wei(
+        self,
+        amount_wei: int,
+        to_address: str,
+    ) -> TransactionResult:
+        if not isinstance(amount_wei, int):
+            raise TransactionException("Expected int for amount_wei")
+
+        tx_data = await self.build_transaction_data(**{
+            'to': address_to_bytes(to_address),
+            'value': amount_wei,
+        })
+
+        return await self.send_transaction(tx_data)
+
+    async def build_transaction_data(
+        self,
+        **override_parameters: Any
+    ) -> Dict[str, Any]:
+        gas_fees = await self.get_gas_fees() if needs_gas_fees(override_parameters) else None
+        return validate_transaction_data(override_parameters, gas_fees, self._nonce_state, self._chain_id)
+
+    async def verify_transaction(
+        self,
+        transaction_hash: Union[str, HexBytes],
+        timeout: Optional[int] = 120
+    ) -> TransactionStatus:
+        import aiohttp
+        from web3.exceptions import TimeExhausted
+
+        try:
+            receipt = await self._web3.eth.wait_for_transaction_receipt(
+                transaction_hash,
+                timeout=timeout,
+                poll_latency=self.poll_latency
+            )
+            return TransactionStatus(receipt.status)
+        except (TimeExhausted, aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning("Error verifying transaction: %s", e)
+            return TransactionStatus.NOT_VERIFIED
+
+    async def send_transaction(
+        self,
+        transaction: TxParams
+    ) -> TransactionResult:
+        import aiohttp
+        from web3.exceptions import Web3RPCError
+
+        raw_transaction = sign_transaction(self._local_account, transaction, self._nonce_state)
+
+        nonce = transaction.get('nonce')
+        try:
+            transaction_hash = await self._web3.eth.send_raw_transaction(raw_transaction)
+        except (ValueError, Web3RPCError) as e:
+            if is_underpriced_error(e):
+                self._gas_fee_cache = None
+            if is_nonce_error(e):
+                await self.sync_nonce()
+            else:
+                self._nonce_state.release(nonce)
+            raise TransactionException(f"RPC error sending tx: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._nonce_state.release(nonce)
+            raise TransactionException(f"Network error: {e}")
+
+        self._nonce_state.advance(nonce)
+
+        status = await self.verify_transaction(transaction_hash)
+        return TransactionResult(status=status, transactionHash=transaction_hash, rawTransaction=raw_transaction)
+
+    async def sync_nonce(self) -> int:
+        async with self._nonce_sync_lock:
+            pending = await self._web3.eth.get_transaction_count(self._account_address, 'pending')
+            return self._nonce_state.sync(pending)
+
+    def get_web3(self) -> AsyncWeb3:
+        return self._web3
+
+    def get_address(self) -> ChecksumAddress:
+        return self._account_address
+
+    async def _initialize_web3(self) -> None:
+        import aiohttp
+        from web3 import AsyncHTTPProvider, AsyncWeb3
+
+        self._web3 = AsyncWeb3(AsyncHTTPProvider(
+            self.rpc_endpoint,
+            request_kwargs={'timeout': aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)}
+        ))
+
+        retried = 0
+        while not await self._web3.is_connected():
+            if retried == self.retries:
+                await self._web3.provider.disconnect()
+                raise Web3ConnectionException(f"Unable to connect to RPC endpoint after {retried + 1} attempts")
+
+            delay = connect_delay(retried)
+            retried += 1
+            logger.warning(
+                "Web3 connection failed (attempt %d of %s). Retrying in %.2fs..",
+                retried, self.retries, delay
+            )
+            await asyncio.sleep(delay)
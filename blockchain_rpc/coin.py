@@ -28,11 +28,11 @@ class ERC20Coin(BaseContract):
         if not isinstance(amount, int):
             raise CoinException("Expected int for amount")
 
-        transaction = self._contract.functions.approve(
-            address,
-            amount
-        ).build_transaction(
-            self._web3node.build_transaction_data()
+        transaction = self._web3node.build_contract_transaction(
+            self._contract.functions.approve(
+                address,
+                amount
+            )
         )
 
         return self._web3node.send_transaction(transaction)
@@ -6,14 +6,17 @@ load_dotenv()
 PRIVATE_KEY         = os.getenv("PRIVATE_KEY")
 
 TESTNET_ENDPOINT    = os.getenv("TESTNET_ENDPOINT")
+TESTNET_ENDPOINT_WS = os.getenv("TESTNET_ENDPOINT_WS")
 TO_ADDRESS          = os.getenv("TO_ADDRESS")
 
 ENDPOINT_1          = os.getenv("ENDPOINT_1")
 SWAP_ADDRESS_1      = os.getenv("SWAP_ADDRESS_1")
 COIN_1_ADDRESS_1    = os.getenv("COIN_1_ADDRESS_1")
 COIN_2_ADDRESS_1    = os.getenv("COIN_2_ADDRESS_1")
+EXECUTOR_ADDRESS_1  = os.getenv("EXECUTOR_ADDRESS_1")
 
 ENDPOINT_2          = os.getenv("ENDPOINT_2")
 SWAP_ADDRESS_2      = os.getenv("SWAP_ADDRESS_2")
 COIN_1_ADDRESS_2    = os.getenv("COIN_1_ADDRESS_2")
 COIN_2_ADDRESS_2    = os.getenv("COIN_2_ADDRESS_2")
+EXECUTOR_ADDRESS_2  = os.getenv("EXECUTOR_ADDRESS_2")
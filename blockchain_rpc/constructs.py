@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Any, List
+from eth_abi.exceptions import EncodingError
+from eth_typing import HexStr
+from eth_utils import encode_hex, function_abi_to_4byte_selector, get_abi_input_types
 from web3.contract import Contract
+from web3.exceptions import ABIFunctionNotFound
 from web3.types import ChecksumAddress
 
 from .web3node import Web3Node, validate_web3_node
@@ -47,10 +52,18 @@ class BaseContract(ABC):
     ) -> ChecksumAddress:
         return self._address
 
+    def get_web3node(
+        self
+    ) -> Web3Node:
+        return self._web3node
+
 class BaseSwapper(BaseContract):
     """Template class for all swappers. 
     Extension of Base Contract
 
+    The swap function named by _swap_signature is resolved from the ABI 
+    once, so each swap only has to ABI-encode its arguments.
+
     Attributes
     ------------
     _address: :class:`str`
@@ -59,7 +72,39 @@ class BaseSwapper(BaseContract):
         Instance of custom Web3Node class.
     _contract: :class:`Contract`
         Initialized contract.
+    _swap_selector: :class:`bytes`
+        4 byte selector of the swap function.
+    _swap_types: :class:`List[str]`
+        ABI input types of the swap function.
     """
+    _swap_signature: str
+
+    def __init__(
+        self, 
+        address: str, 
+        abi: ABI, 
+        _web3node: Web3Node
+    ):
+        super().__init__(address, abi, _web3node)
+
+        try:
+            swap_abi = self._contract.get_function_by_signature(self._swap_signature).abi
+        except (ValueError, ABIFunctionNotFound) as e:
+            raise SwapException(f"Swap function {self._swap_signature} not found: {e}") from e
+
+        self._swap_selector: bytes = function_abi_to_4byte_selector(swap_abi)
+        self._swap_types: List[str] = get_abi_input_types(swap_abi)
+
+    def _encode_swap_call(
+        self,
+        *args: Any
+    ) -> HexStr:
+        try:
+            encoded_args = self._web3node.get_web3().codec.encode(self._swap_types, args)
+        except EncodingError as e:
+            raise SwapException(f"Error encoding swap: {e}") from e
+        return HexStr(encode_hex(self._swap_selector + encoded_args))
+
     @abstractmethod
     def swap(
         self, 
@@ -67,6 +112,14 @@ class BaseSwapper(BaseContract):
         **kwargs
     ) -> TransactionResult:
         pass
+
+    @abstractmethod
+    def encode_swap(
+        self, 
+        *args, 
+        **kwargs
+    ) -> HexStr:
+        pass
     
 class BaseProgram(ABC):
     """Abstract class for all programs."""
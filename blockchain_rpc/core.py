@@ -1,34 +1,117 @@
 import asyncio
+import contextvars
+import functools
+import logging
+import os
+import random
 from concurrent.futures import ThreadPoolExecutor
-import time
-from typing import Optional
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+from web3 import AsyncWeb3, WebSocketProvider
 from web3.types import Address, ChecksumAddress
-from web3.exceptions import TimeExhausted
+from web3.exceptions import ProviderConnectionError, TimeExhausted
+from websockets.exceptions import ConnectionClosed
 import requests
 
 from .models import (
     TransactionStatus, 
+    TransactionResult, 
     ListenAndSendConfig, 
     ArbitrageConfig
 )
 from .constructs import BaseProgram, BaseSwapper
 from .config import (
     TESTNET_ENDPOINT, 
+    TESTNET_ENDPOINT_WS,
     TO_ADDRESS, 
     ENDPOINT_1, 
     SWAP_ADDRESS_1, 
     COIN_1_ADDRESS_1, 
     COIN_2_ADDRESS_1,
+    EXECUTOR_ADDRESS_1,
     ENDPOINT_2,
     SWAP_ADDRESS_2,
     COIN_1_ADDRESS_2,
-    COIN_2_ADDRESS_2
+    COIN_2_ADDRESS_2,
+    EXECUTOR_ADDRESS_2
 )
 from .web3node import Web3Node
+from .errors import TransactionException
 from .utils import validate_address
 from .swap import Uniswap, Curve
 from .abi_loader import ABILoader
 from .coin import ERC20Coin
+from .executor import SwapExecutor
+
+logger = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 1.0
+_MAX_BACKOFF = 30
+
+_RETRY_DELAY = 0.5
+_MAX_RETRY_DELAY = 8
+_RETRY_JITTER = 0.2
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) + 4),
+    thread_name_prefix="rpc"
+)
+
+T = TypeVar("T")
+
+async def _to_thread(
+    func: Callable[..., T], 
+    *args: Any
+) -> T:
+    """
+    asyncio.to_thread on the shared module executor, so worker threads and 
+    their keep-alive connections outlive a single program run.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(context.run, func, *args))
+
+async def _with_retry(
+    func: Callable[..., TransactionResult], 
+    *args: Any,
+    web3node: Web3Node,
+    retries: int,
+    label: str
+) -> TransactionResult:
+    """
+    Sends a transaction until it succeeds or retries run out, backing off 
+    exponentially with jitter between attempts.
+
+    A transaction that was sent but not verified may still be mined, so 
+    it is resubmitted unchanged through Web3Node.resend_transaction 
+    instead of being sent again with a new nonce.
+    """
+    result = await _to_thread(func, *args)
+
+    for retried in range(retries):
+        if result.status == TransactionStatus.SUCCESS:
+            break
+        logger.warning("%s Unsucessful", label)
+        logger.warning("Retrying...")
+        await asyncio.sleep(min(_MAX_RETRY_DELAY, _RETRY_DELAY * 2 ** retried) + random.random() * _RETRY_JITTER)
+
+        if result.status != TransactionStatus.NOT_VERIFIED:
+            result = await _to_thread(func, *args)
+            continue
+
+        try:
+            result = await _to_thread(web3node.resend_transaction, result)
+        except TransactionException as e:
+            logger.warning("%s Resend rejected: %s", label, e)
+
+    if result.status == TransactionStatus.SUCCESS:
+        logger.info("%s Succeeded", label)
+    elif result.status == TransactionStatus.FAILURE:
+        logger.warning("%s Processed but Failed", label)
+    else:
+        logger.warning("%s Not Processed", label)
+
+    return result
 
 class ListenAndSend(BaseProgram):
     """
@@ -52,6 +135,10 @@ class ListenAndSend(BaseProgram):
     _web3node: :class:`Web3Node`
         Instance of custom Web3Node class responsible for sending and 
         building transactions.
+    _subscriber: :class:`AsyncWeb3`
+        WebSocket backed AsyncWeb3 instance that receives new block 
+        headers pushed by the node. When no WebSocket endpoint is 
+        configured, blocks are polled every _POLL_INTERVAL seconds instead.
     """
     def __init__(
         self, 
@@ -70,54 +157,89 @@ class ListenAndSend(BaseProgram):
         
         self.to_address: ChecksumAddress = validate_address(TO_ADDRESS)
         self._web3node: Optional[Web3Node] = None
+        self._subscriber: Optional[AsyncWeb3] = None
 
         self._instantiate()
 
     def _instantiate(self) -> None:
-        print("Connecting to RPC endpoint...")
+        logger.info("Connecting to RPC endpoint...")
         self._web3node = Web3Node(TESTNET_ENDPOINT, self.retries)
-        print("Connected")
+        if TESTNET_ENDPOINT_WS:
+            self._subscriber = AsyncWeb3(WebSocketProvider(TESTNET_ENDPOINT_WS))
+        logger.info("Connected")
+
+    async def _send(self) -> None:
+        logger.info("Sending ETH...")
+        await _with_retry(
+            self._web3node.send_ETH,
+            self.amount,
+            self.to_address,
+            web3node=self._web3node,
+            retries=self.retries,
+            label="Transaction"
+        )
+
+    async def _subscribe_blocks(self) -> AsyncIterator[int]:
+        async with self._subscriber as local_web3:
+            await local_web3.eth.subscribe("newHeads")
 
-    def execute(self) -> None:
-        print("Starting execution...")
+            async for response in local_web3.socket.process_subscriptions():
+                yield response["result"]["number"]
 
+    async def _poll_blocks(self) -> AsyncIterator[int]:
         local_web3 = self._web3node.get_web3()
-        current_number = local_web3.eth.get_block("latest").number
+        current_number = await _to_thread(local_web3.eth.get_block_number)
+
+        while True:
+            await asyncio.sleep(_POLL_INTERVAL)
+            latest_number = await _to_thread(local_web3.eth.get_block_number)
+
+            for number in range(current_number + 1, latest_number + 1):
+                yield number
+            current_number = max(current_number, latest_number)
+
+    def _watch_blocks(self) -> AsyncIterator[int]:
+        if self._subscriber is not None:
+            return self._subscribe_blocks()
+        return self._poll_blocks()
+
+    async def execute(self) -> None:
+        logger.info("Starting execution...")
+
         block_count = 0
-        print(f"Block number: {current_number}")
+        retried = 0
 
         try:
-            while(True):
+            while True:
                 try:
-                    latest_number = local_web3.eth.get_block("latest").number
-                    if latest_number != current_number:
-                        current_number = latest_number
-                        print(f"Block number: {current_number}")
-                        block_count = (block_count + 1) % self.num_blocks
-
-                        if block_count == 0:
-                            print("Sending ETH...")
-                            result = self._web3node.send_ETH(self.amount, self.to_address)
+                    async with aclosing(self._watch_blocks()) as blocks:
+                        async for current_number in blocks:
                             retried = 0
-                            
-                            while result.status != TransactionStatus.SUCCESS and retried != self.retries:
-                                print("Transaction Unsucessful")
-                                print("Retrying...")
-                                retried += 1
-                                result = self._web3node.send_ETH(self.amount, self.to_address)
-
-                            if result.status == TransactionStatus.SUCCESS:
-                                print("Transaction Succeeded")
-                            elif result.status == TransactionStatus.FAILURE:
-                                print("Transaction Processed but Failed")
-                            else:
-                                print("Transaction Not Processed")
-                except (requests.exceptions.HTTPError, TimeExhausted) as e:
-                    print(f"Request Error: {e}")
-                    print("Retrying...")
-                    time.sleep(3)
+                            logger.info("Block number: %s", current_number)
+                            block_count = (block_count + 1) % self.num_blocks
+
+                            if block_count == 0:
+                                await self._send()
+                except (
+                    ConnectionClosed, 
+                    ProviderConnectionError, 
+                    requests.exceptions.ConnectionError, 
+                    requests.exceptions.HTTPError, 
+                    TimeExhausted
+                ) as e:
+                    delay = min(_MAX_BACKOFF, 2 ** retried)
+                    retried += 1
+                    logger.warning("Request Error: %s", e)
+                    logger.warning("Retrying in %ss...", delay)
+                    await asyncio.sleep(delay)
         except KeyboardInterrupt:
-            print("\nProgram interrupted. Exiting gracefully...")
+            logger.info("Program interrupted. Exiting gracefully...")
+        except asyncio.CancelledError:
+            # Cancellation has to reach the caller, asyncio.run turns it into KeyboardInterrupt
+            logger.info("Program interrupted. Exiting gracefully...")
+            raise
+        finally:
+            self._web3node.close()
                         
 class Arbitrage(BaseProgram):
     """
@@ -131,8 +253,6 @@ class Arbitrage(BaseProgram):
     ------------
     amount: :class:`int`
         Amount of Coin to send.
-    loop: :class:`asyncio.AbstractEventLoop`
-        Execution loop to enable concurrent execution.
     retries: :class:`int`
         Optional int representing number of retries for reconnecting 
         to Web3, resending failed approvals, retrying failed swaps.
@@ -154,11 +274,15 @@ class Arbitrage(BaseProgram):
     _coin2_2: :class:`ERC20Coin`
         Initialized instance of a ERC20Coin class pertaining to
         second endpoint of the arbitrage. The coin we receive.
+    _executor_1: :class:`SwapExecutor`
+        Optional executor contract on the first endpoint. When set, the 
+        approval and swap are sent as a single transaction.
+    _executor_2: :class:`SwapExecutor`
+        Optional executor contract on the second endpoint.
     """
     def __init__(
         self, 
         amount: int, 
-        loop: asyncio.AbstractEventLoop,
         retries: Optional[int] = 5
     ):  
         config = ArbitrageConfig(
@@ -167,7 +291,6 @@ class Arbitrage(BaseProgram):
         )
         self.amount: float = config.amount
         self.retries: Optional[int] = config.retries
-        self.loop: asyncio.AbstractEventLoop = loop
 
         self._web3node_1: Optional[Web3Node] = None
         self._web3node_2: Optional[Web3Node] = None
@@ -178,15 +301,22 @@ class Arbitrage(BaseProgram):
         self._coin1_1: Optional[ERC20Coin] = None
         self._coin2_2: Optional[ERC20Coin] = None
 
+        self._executor_1: Optional[SwapExecutor] = None
+        self._executor_2: Optional[SwapExecutor] = None
+
         self._instantiate()
     
     def _instantiate(self) -> None:
-        print("Initializing Arbitrage...")
+        logger.info("Initializing Arbitrage...")
         
         abi_loader = ABILoader()
 
         self._web3node_1 = Web3Node(ENDPOINT_1, self.retries)
-        self._web3node_2 = Web3Node(ENDPOINT_2, self.retries)
+        try:
+            self._web3node_2 = Web3Node(ENDPOINT_2, self.retries)
+        except BaseException:
+            self._web3node_1.close()
+            raise
 
         self._swapper_1 = Uniswap(
             SWAP_ADDRESS_1, 
@@ -210,71 +340,72 @@ class Arbitrage(BaseProgram):
             self._web3node_2
         )
 
-        print("Initialized.")
-
-    def _swap(self, sell_coin: ERC20Coin, swapper: BaseSwapper, buy_coin_address: Address) -> None:
-        result = sell_coin.approve(swapper.get_address(), self.amount)
-        retried = 0
-                
-        while result.status != TransactionStatus.SUCCESS and retried != self.retries:
-            print("Approval Unsucessful")
-            print("Retrying...")
-            retried += 1
-            result = sell_coin.approve(swapper.get_address(), self.amount)
+        if EXECUTOR_ADDRESS_1:
+            self._executor_1 = SwapExecutor(
+                EXECUTOR_ADDRESS_1,
+                abi_loader.get_abi("swap_executor"),
+                self._web3node_1
+            )
+        if EXECUTOR_ADDRESS_2:
+            self._executor_2 = SwapExecutor(
+                EXECUTOR_ADDRESS_2,
+                abi_loader.get_abi("swap_executor"),
+                self._web3node_2
+            )
 
-        if result.status == TransactionStatus.SUCCESS:
-            print("Approval Succeeded")
-        elif result.status == TransactionStatus.FAILURE:
-            print("Approval Processed but Failed")
-            return
-        else:
-            print("Approval Not Processed")
-            return
-        
+        logger.info("Initialized.")
 
-        result = swapper.swap(
+    async def _approve_and_swap(self, executor: SwapExecutor, sell_coin: ERC20Coin, swapper: BaseSwapper, buy_coin_address: Address) -> None:
+        swap_calldata = await _to_thread(
+            swapper.encode_swap,
             sell_coin.get_address(), 
             buy_coin_address, 
             self.amount
         )
-        retried = 0
-                
-        while result.status != TransactionStatus.SUCCESS and retried != self.retries:
-            print("Swap Unsucessful")
-            print("Retrying...")
-            retried += 1
-            result = self._swapper_1.swap(
-                sell_coin.get_address(), 
-                buy_coin_address, 
-                self.amount
-            )
+        await _with_retry(
+            executor.approve_and_swap,
+            sell_coin.get_address(),
+            swapper.get_address(),
+            swap_calldata,
+            web3node=executor.get_web3node(),
+            retries=self.retries,
+            label="Approve and Swap"
+        )
 
-        if result.status == TransactionStatus.SUCCESS:
-            print("Swap Succeeded")
-        elif result.status == TransactionStatus.FAILURE:
-            print("Swap Processed but Failed")
+    async def _swap(self, sell_coin: ERC20Coin, swapper: BaseSwapper, buy_coin_address: Address, executor: Optional[SwapExecutor] = None) -> None:
+        if executor is not None:
+            await self._approve_and_swap(executor, sell_coin, swapper, buy_coin_address)
             return
-        else:
-            print("Swap Not Processed")
+
+        result = await _with_retry(
+            sell_coin.approve,
+            swapper.get_address(),
+            self.amount,
+            web3node=sell_coin.get_web3node(),
+            retries=self.retries,
+            label="Approval"
+        )
+        if result.status != TransactionStatus.SUCCESS:
             return
 
+        await _with_retry(
+            swapper.swap,
+            sell_coin.get_address(), 
+            buy_coin_address, 
+            self.amount,
+            web3node=swapper.get_web3node(),
+            retries=self.retries,
+            label="Swap"
+        )
+
     async def execute(self) -> None:
-        print("Starting execution...")
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            swap_1_coroutine = self.loop.run_in_executor(
-                executor,
-                self._swap,
-                self._coin1_1,
-                self._swapper_1,
-                COIN_2_ADDRESS_1,
-            )
-            swap_2_coroutine = self.loop.run_in_executor(
-                executor,
-                self._swap,
-                self._coin2_2,
-                self._swapper_2,
-                COIN_1_ADDRESS_2,
-            )
+        logger.info("Starting execution...")
 
-            await asyncio.gather(swap_1_coroutine, swap_2_coroutine)
+        try:
+            await asyncio.gather(
+                self._swap(self._coin1_1, self._swapper_1, COIN_2_ADDRESS_1, self._executor_1),
+                self._swap(self._coin2_2, self._swapper_2, COIN_1_ADDRESS_2, self._executor_2),
+            )
+        finally:
+            self._web3node_1.close()
+            self._web3node_2.close()
@@ -32,3 +32,8 @@ class CoinException(Exception):
     """Error when processing coins"""
 
     pass
+
+class MulticallException(Exception):
+    """Error when aggregating calls through Multicall3"""
+
+    pass
@@ -0,0 +1,44 @@
+from eth_typing import HexStr
+from web3.types import ChecksumAddress
+
+from .models import TransactionResult
+from .constructs import BaseContract
+from .utils import validate_address
+
+class SwapExecutor(BaseContract):
+    """
+    Executor (proxy) contract that approves a swapper and runs its swap 
+    calldata within one transaction.
+    Extension of BaseContract.
+
+    The swap runs with the executor as msg.sender, so the executor itself 
+    (e.g. a DS-Proxy owned by the account) must hold the sell coin balance. 
+    Coins held only by the account are not pulled in and the swap reverts.
+
+    Attributes
+    ------------
+    _address: :class:`str`
+        Address of smart contract.
+    _web3node: :class:`Web3Node`
+        Instance of custom Web3Node class.
+    _contract: :class:`Contract`
+        Initialized contract.
+    """
+    def approve_and_swap(
+        self,
+        coin_address: ChecksumAddress,
+        swapper_address: ChecksumAddress,
+        swap_calldata: HexStr
+    ) -> TransactionResult:
+        validate_address(coin_address)
+        validate_address(swapper_address)
+
+        transaction = self._web3node.build_contract_transaction(
+            self._contract.functions.approveAndSwap(
+                coin_address,
+                swapper_address,
+                swap_calldata
+            )
+        )
+
+        return self._web3node.send_transaction(transaction)
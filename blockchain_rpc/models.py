@@ -1,9 +1,12 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, field_validator, validator
 from enum import Enum
-from web3.types import Nonce, ChecksumAddress
+from eth_typing import ChecksumAddress
 from typing import NamedTuple, Any, Dict, List, Optional, TypeAlias, Union
 from hexbytes import HexBytes
 
+from .errors import InvalidAddressException
+from .utils import address_to_bytes
+
 ABIEntry: TypeAlias = Dict[str, Any]
 ABI: TypeAlias = List[ABIEntry]
 
@@ -14,32 +17,59 @@ class DictionaryTranslatable(BaseModel):
     def to_dictionary(
         self
     ) -> Dict[str, Any]:
-        return self.dict(exclude_none=True)
+        return self.model_dump(exclude_none=True)
 
 class TransactionData(DictionaryTranslatable):
     """
     Template for all transactions sent on Web3.
     """
-    nonce: Nonce
+    nonce: int
     maxFeePerGas: int
     maxPriorityFeePerGas: int
     chainId: int
     value: int | None = 0
     gas: int | None = 400000
-    to: ChecksumAddress | None = None
+    to: bytes | None = None
     data: str | None = None
+
+    @field_validator('to', mode='before')
+    @classmethod
+    def validate_to(cls, value) -> bytes | None:
+        # Kept as the 20 raw bytes the signer encodes, so the hex is parsed once
+        if value is None or (isinstance(value, bytes) and len(value) == 20):
+            return value
+        if isinstance(value, bytes):
+            raise ValueError('to must be a 20 byte address')
+        try:
+            return address_to_bytes(value)
+        except InvalidAddressException as e:
+            raise ValueError(str(e))
     
-class UniswapData(DictionaryTranslatable):
-    """
-    Template for parameters on all Uniwswap Swaps.
-    """
-    tokenIn: ChecksumAddress
-    tokenOut: ChecksumAddress
-    fee: int | None = 100
-    recipient: ChecksumAddress
-    amountIn: int
-    amountOutMinimum: int | None = 0
-    sqrtPriceLimitX96: int | None = 0
+def build_uniswap_params(
+    tokenIn: ChecksumAddress,
+    tokenOut: ChecksumAddress,
+    recipient: ChecksumAddress,
+    amountIn: int,
+    *,
+    fee: int = 100,
+    amountOutMinimum: int = 0,
+    sqrtPriceLimitX96: int = 0
+) -> Dict[str, Any]:
+    """
+    Builds the parameters for all Uniswap Swaps.
+
+    A plain dictionary rather than a model since it is built on every swap 
+    and the addresses are already checksummed.
+    """
+    return {
+        'tokenIn': tokenIn,
+        'tokenOut': tokenOut,
+        'fee': fee,
+        'recipient': recipient,
+        'amountIn': amountIn,
+        'amountOutMinimum': amountOutMinimum,
+        'sqrtPriceLimitX96': sqrtPriceLimitX96,
+    }
 
 class CurveData(BaseModel):
     """
@@ -73,9 +103,27 @@ class GasFees(NamedTuple):
 class TransactionResult(NamedTuple):
     """
     Storing results of Transactions including status and hash for tracing.
+    The signed bytes are kept so an unverified transaction can be resent 
+    unchanged.
     """
     status: TransactionStatus
     transactionHash: Union[str, HexBytes]
+    rawTransaction: Optional[bytes] = None
+
+class ContractCall(NamedTuple):
+    """
+    Single read call aggregated through Multicall3.
+    """
+    target: ChecksumAddress
+    callData: Union[str, bytes]
+    allowFailure: bool = True
+
+class CallResult(NamedTuple):
+    """
+    Storing the outcome of one aggregated call.
+    """
+    success: bool
+    returnData: bytes
 
 class ListenAndSendConfig(BaseModel):
     """
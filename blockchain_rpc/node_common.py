@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from pydantic import TypeAdapter, ValidationError
+
+from .errors import InvalidPrivateKeyException, TransactionException
+from .models import TransactionData, GasFees
+
+# Shared by Web3Node and AsyncWeb3Node. eth_account is imported where it is
+# used, like web3 in the nodes themselves
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+    from web3.types import TxParams
+
+REQUEST_TIMEOUT = 10
+CONNECT_DELAY = 0.1
+MAX_CONNECT_DELAY = 5.0
+GAS_FEE_TTL = 5.0
+UNDERPRICED_ERRORS = ('underpriced', 'less than block base fee')
+NONCE_ERRORS = ('nonce too low', 'known transaction', 'already known')
+TRANSACTION_DATA_ADAPTER = TypeAdapter(TransactionData)
+
+_WEI_PER_ETHER = 10 ** 18
+_GWEI_PER_ETHER = 10 ** 9
+_WEI_PER_GWEI = 10 ** 9
+_MAX_EXACT_GWEI = 2 ** 50
+
+@dataclass
+class NonceState:
+    """
+    Local nonce of one account, handed out without a round trip per
+    transaction.
+
+    Attributes
+    ------------
+    nonce: :class:`int`
+        Next nonce for the account.
+    lock: :class:`threading.Lock`
+        Guards nonce.
+    references: :class:`int`
+        Number of open nodes sharing the state.
+    """
+    nonce: Optional[int] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    references: int = 0
+
+    def reserve(self) -> int:
+        with self.lock:
+            nonce = self.nonce
+            self.nonce += 1
+            return nonce
+
+    def release(
+        self,
+        nonce: Optional[int]
+    ) -> bool:
+        # Only the latest reservation can be handed back without leaving a gap
+        with self.lock:
+            if nonce is not None and self.nonce == nonce + 1:
+                self.nonce = nonce
+                return True
+            return False
+
+    def sync(
+        self,
+        pending: int
+    ) -> int:
+        # Never moves back, the node's pending count does not include nonces
+        # that other senders have reserved but not submitted yet
+        with self.lock:
+            self.nonce = pending if self.nonce is None else max(self.nonce, pending)
+            return self.nonce
+
+    def advance(
+        self,
+        nonce: Optional[int]
+    ) -> None:
+        # An accepted transaction may carry a nonce that was never reserved here
+        if nonce is not None:
+            with self.lock:
+                self.nonce = max(self.nonce, nonce + 1)
+
+def needs_gas_fees(
+    override_parameters: Dict[str, Any]
+) -> bool:
+    return 'maxFeePerGas' not in override_parameters or 'maxPriorityFeePerGas' not in override_parameters
+
+def validate_transaction_data(
+    override_parameters: Dict[str, Any],
+    gas_fees: Optional[GasFees],
+    nonce_state: NonceState,
+    chain_id: int
+) -> Dict[str, Any]:
+    if gas_fees is not None:
+        override_parameters.setdefault('maxFeePerGas', gas_fees.maxFeePerGas)
+        override_parameters.setdefault('maxPriorityFeePerGas', gas_fees.maxPriorityFeePerGas)
+
+    reserved_nonce = None
+    if 'nonce' not in override_parameters:
+        reserved_nonce = override_parameters['nonce'] = nonce_state.reserve()
+    override_parameters.setdefault('chainId', chain_id)
+    try:
+        return TRANSACTION_DATA_ADAPTER.validate_python(override_parameters).to_dictionary()
+    except ValidationError as e:
+        nonce_state.release(reserved_nonce)
+        raise TransactionException(f"Error building transaction: {e}")
+
+def sign_transaction(
+    local_account: LocalAccount,
+    transaction: TxParams,
+    nonce_state: Optional[NonceState]
+) -> bytes:
+    # Callers that track their own gaps pass no nonce_state and release themselves
+    try:
+        return local_account.sign_transaction(transaction).raw_transaction
+    except (ValueError, TypeError) as e:
+        if nonce_state is not None:
+            nonce_state.release(transaction.get('nonce'))
+        raise TransactionException(f"Signing failed: {e}")
+
+def is_underpriced_error(
+    error: Any
+) -> bool:
+    message = str(error).lower()
+    return any(underpriced in message for underpriced in UNDERPRICED_ERRORS)
+
+def is_nonce_error(
+    error: Any
+) -> bool:
+    message = str(error).lower()
+    return any(nonce_error in message for nonce_error in NONCE_ERRORS)
+
+def connect_delay(
+    retried: int
+) -> float:
+    return min(CONNECT_DELAY * 2 ** retried, MAX_CONNECT_DELAY) * (0.5 + random.random())
+
+def load_account(
+    private_key: str
+) -> LocalAccount:
+    from eth_account import Account
+
+    try:
+        return Account.from_key(private_key)
+    except (ValueError, TypeError) as e:
+        raise InvalidPrivateKeyException(f"Environment private key is invalid: {e}")
+
+def ether_to_wei(
+    amount: float
+) -> int:
+    # Amounts with at most 9 decimals are exact in whole gwei while the gwei
+    # count stays well inside float precision. Anything else converts the
+    # float's shortest repr exactly through Decimal(str(amount)), which can
+    # differ from Web3.to_wei in the last wei for many-digit amounts below
+    # 1 ETH, where to_wei scales the binary value instead
+    gwei = round(amount * _GWEI_PER_ETHER)
+    if abs(gwei) < _MAX_EXACT_GWEI and gwei / _GWEI_PER_ETHER == amount:
+        return gwei * _WEI_PER_GWEI
+    return int(Decimal(str(amount)) * _WEI_PER_ETHER)
@@ -0,0 +1,126 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import requests
+from web3 import HTTPProvider
+from web3.providers.base import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_MAX_KEEPALIVE_CONNECTIONS = 8
+
+_deadline = threading.local()
+
+@contextmanager
+def request_deadline(
+    deadline: Optional[float]
+) -> Iterator[None]:
+    """
+    Caps the timeout of every request the calling thread sends through 
+    these providers at the time left before deadline, a time.monotonic() 
+    value. None leaves the providers' own timeouts in place.
+    """
+    previous = getattr(_deadline, 'value', None)
+    _deadline.value = deadline
+    try:
+        yield
+    finally:
+        _deadline.value = previous
+
+def _request_timeout(
+    timeout: float
+) -> float:
+    deadline = getattr(_deadline, 'value', None)
+    if deadline is None:
+        return timeout
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        # Not one of the errors web3 retries on, so an expired deadline stops at once
+        raise requests.exceptions.ConnectionError("Request deadline exceeded")
+    return min(timeout, remaining)
+
+class BoundedHTTPProvider(HTTPProvider):
+    """
+    HTTPProvider whose request timeout honours request_deadline.
+    """
+    def get_request_kwargs(self) -> Dict[str, Any]:
+        request_kwargs = super().get_request_kwargs()
+        request_kwargs['timeout'] = _request_timeout(request_kwargs['timeout'])
+        return request_kwargs
+
+class HTTP2Provider(JSONBaseProvider):
+    """
+    JSON-RPC provider multiplexing requests over a single HTTP/2 connection.
+
+    Requires the optional httpx[http2] dependency.
+
+    Attributes
+    ------------
+    endpoint_uri: :class:`str`
+        URL for rpc endpoint.
+    timeout: :class:`float`
+        Seconds allowed per request, capped by request_deadline.
+    _client: :class:`httpx.Client`
+        HTTP/2 client kept open between requests.
+    """
+    def __init__(
+        self,
+        endpoint_uri: str,
+        timeout: float = 10
+    ):
+        if httpx is None:
+            raise ImportError("HTTP2Provider requires httpx[http2] to be installed")
+        super().__init__()
+
+        self.endpoint_uri: str = endpoint_uri
+        self.timeout: float = timeout
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS),
+            headers={'Content-Type': 'application/json'},
+        )
+
+    def make_request(
+        self,
+        method: RPCEndpoint,
+        params: Any
+    ) -> RPCResponse:
+        raw_response = self._post(self.encode_rpc_request(method, params))
+        return self.decode_rpc_response(raw_response)
+
+    def make_batch_request(
+        self,
+        batch_requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        raw_response = self._post(self.encode_batch_rpc_request(batch_requests))
+        response = self.decode_rpc_response(raw_response)
+        if not isinstance(response, list):
+            return response
+        return sorted(response, key=lambda result: result['id'])
+
+    def close(self) -> None:
+        self._client.close()
+
+    def _post(
+        self,
+        request_data: bytes
+    ) -> bytes:
+        # Re-raised as requests errors so callers handle both providers the same way
+        try:
+            response = self._client.post(
+                self.endpoint_uri, 
+                content=request_data, 
+                timeout=_request_timeout(self.timeout)
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise requests.exceptions.HTTPError(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        return response.content
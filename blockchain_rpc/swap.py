@@ -1,10 +1,10 @@
-import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from eth_typing import HexStr
 from web3.types import ChecksumAddress
 from pydantic import ValidationError
 from web3.exceptions import ContractLogicError, ABIFunctionNotFound
 
-from .models import UniswapData, TransactionResult, CurveData
+from .models import build_uniswap_params, TransactionResult, CurveData
 from .constructs import BaseSwapper
 from .errors import SwapException
 
@@ -22,29 +22,48 @@ class Uniswap(BaseSwapper):
     _contract: :class:`Contract`
         Initialized contract.
     """
-    def swap(
+    _swap_signature = "exactInputSingle((address,address,uint24,address,uint256,uint256,uint160))"
+
+    def _prepare_swap(
         self,
         sell_coin_address: ChecksumAddress, 
         buy_coin_address: ChecksumAddress, 
         amount: int,
         **addtional_parameters: Any
-    ) -> TransactionResult:
-
+    ) -> Dict[str, Any]:
         try:
-            swap_data = UniswapData(
+            return build_uniswap_params(
                 tokenIn=sell_coin_address,
                 tokenOut=buy_coin_address,
                 recipient=self._web3node.get_address(),
                 amountIn=amount,
                 **addtional_parameters
-            ).to_dictionary()
-        except ValidationError as e:
+            )
+        except TypeError as e:
             raise SwapException(f"Error building swap: {e}") from e
-        
-        transaction = self._contract.functions.exactInputSingle(
-            swap_data
-        ).build_transaction(
-            self._web3node.build_transaction_data()
+
+    def encode_swap(
+        self,
+        sell_coin_address: ChecksumAddress, 
+        buy_coin_address: ChecksumAddress, 
+        amount: int,
+        **addtional_parameters: Any
+    ) -> HexStr:
+        swap_data = self._prepare_swap(sell_coin_address, buy_coin_address, amount, **addtional_parameters)
+
+        # build_uniswap_params keeps the ExactInputSingleParams field order
+        return self._encode_swap_call(tuple(swap_data.values()))
+
+    def swap(
+        self,
+        sell_coin_address: ChecksumAddress, 
+        buy_coin_address: ChecksumAddress, 
+        amount: int,
+        **addtional_parameters: Any
+    ) -> TransactionResult:
+        transaction = self._web3node.build_transaction_data(
+            to=self._address,
+            data=self.encode_swap(sell_coin_address, buy_coin_address, amount, **addtional_parameters)
         )
 
         return self._web3node.send_transaction(transaction)
@@ -55,7 +74,8 @@ class Curve(BaseSwapper):
     Extension of BaseSwapper.
 
     Curve swaps require a specific coin index for the specific curve pool to swap, 
-    hence the helper method to check the indexes. 
+    hence the helper method to check the indexes. The coins(i) reads are sent 
+    as a single JSON-RPC batch.
 
     Attributes
     ------------
@@ -66,7 +86,9 @@ class Curve(BaseSwapper):
     _contract: :class:`Contract`
         Initialized contract.
     """
-    async def get_coin_indexes(
+    _swap_signature = "exchange(int128,int128,uint256,uint256)"
+
+    def get_coin_indexes(
         self, 
         coin_addresses: List[ChecksumAddress]
     ) -> Dict[ChecksumAddress, int]:
@@ -77,24 +99,27 @@ class Curve(BaseSwapper):
         except (ContractLogicError, ABIFunctionNotFound) as e:
             raise SwapException(f"Error during contract call for coins: {e}") from e
 
-        coin_tasks = [
-            self._lookup_coin(i, coin_set)
-            for i in range(num_coins)
-        ]
+        try:
+            with self._web3node.get_web3().batch_requests() as batch:
+                for i in range(num_coins):
+                    batch.add(self._contract.functions.coins(i))
+                addresses = batch.execute()
+        except (ContractLogicError, ABIFunctionNotFound) as e:
+            raise SwapException(f"Coin index lookup failed: {e}") from e
 
-        results = await asyncio.gather(*coin_tasks)
-        return {k: v for result in results for k, v in result.items()}
+        results = (
+            self._lookup_coin(i, address, coin_set)
+            for i, address in enumerate(addresses)
+        )
+        return dict(result for result in results if result is not None)
     
-    async def _lookup_coin(
+    def _lookup_coin(
         self, 
         index: int, 
+        address: ChecksumAddress,
         coin_set: set
-    ) -> Dict[ChecksumAddress, int]:
-        try:
-            address = self._contract.functions.coins(index).call()
-            return {address: index} if address in coin_set else {}
-        except (ContractLogicError, ABIFunctionNotFound) as e:
-            raise SwapException(f"Coin index lookup failed: {e}") from e
+    ) -> Optional[Tuple[ChecksumAddress, int]]:
+        return (address, index) if address in coin_set else None
     
     def _prepare_swap(
         self, 
@@ -103,7 +128,7 @@ class Curve(BaseSwapper):
         amount: int, 
         min_dy: int
     ) -> CurveData:
-        indexes = asyncio.run(self.get_coin_indexes([sell_coin_address, buy_coin_address]))
+        indexes = self.get_coin_indexes([sell_coin_address, buy_coin_address])
         if len(indexes) != 2:
             raise SwapException("Coins do not exist in pool")
         
@@ -122,19 +147,27 @@ class Curve(BaseSwapper):
         except ValidationError as e:
             raise SwapException(f"Error building swap: {e}") from e
 
-    def swap(
+    def encode_swap(
         self,
         sell_coin_address: ChecksumAddress, 
         buy_coin_address: ChecksumAddress, 
         amount: int,
         min_dy: Optional[int] = 0
-    ) -> TransactionResult:
+    ) -> HexStr:
         swap_data = self._prepare_swap(sell_coin_address, buy_coin_address, amount, min_dy)
 
-        transaction = self._contract.functions.exchange(
-            *swap_data.to_args()
-        ).build_transaction(
-            self._web3node.build_transaction_data()
+        return self._encode_swap_call(*swap_data.to_args())
+
+    def swap(
+        self,
+        sell_coin_address: ChecksumAddress, 
+        buy_coin_address: ChecksumAddress, 
+        amount: int,
+        min_dy: Optional[int] = 0
+    ) -> TransactionResult:
+        transaction = self._web3node.build_transaction_data(
+            to=self._address,
+            data=self.encode_swap(sell_coin_address, buy_coin_address, amount, min_dy)
         )
 
         return self._web3node.send_transaction(transaction)
@@ -1,16 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import threading
 import time
-from typing import Any, Dict, Optional, Union
-import requests
-from web3 import Account, Web3
-from web3.types import ChecksumAddress, TxParams
-from web3.exceptions import TimeExhausted
-from pydantic import ValidationError
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlparse
 from hexbytes import HexBytes
 
 from .config import PRIVATE_KEY
-from .errors import Web3ConnectionException, InvalidPrivateKeyException, TransactionException
-from .models import TransactionData, GasFees, TransactionStatus, TransactionResult
-from .utils import validate_address
+from .errors import (
+    Web3ConnectionException, 
+    InvalidAddressException, 
+    TransactionException, 
+    MulticallException
+)
+from .models import TransactionData, GasFees, TransactionStatus, TransactionResult, ContractCall, CallResult
+from .utils import address_to_bytes
+from .node_common import (
+    REQUEST_TIMEOUT,
+    GAS_FEE_TTL,
+    NonceState,
+    needs_gas_fees,
+    validate_transaction_data,
+    sign_transaction,
+    is_underpriced_error,
+    is_nonce_error,
+    connect_delay,
+    load_account,
+    ether_to_wei
+)
+
+# web3, requests and aiohttp are imported where they are used, so importing 
+# this module stays cheap until a node is actually created
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+    from eth_account.signers.local import LocalAccount
+    from eth_typing import ChecksumAddress
+    from web3 import Web3
+    from web3.providers.base import JSONBaseProvider
+    from web3.contract.contract import ContractFunction
+    from web3.types import TxParams
+
+logger = logging.getLogger(__name__)
+
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 10
+_GAS_FEE_MAX_STALE = 15.0
+_STARTUP_BUDGET = 30.0
+_DEFAULT_GAS = TransactionData.model_fields['gas'].default
+_MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+_AGGREGATE3_SELECTOR = bytes.fromhex('82ad56cb')
+
+@dataclass
+class _EndpointState:
+    """
+    Connection and caches shared by every Web3Node on the same endpoint.
+
+    Attributes
+    ------------
+    session: :class:`requests.Session`
+        Pooled keep-alive HTTP session used by the provider.
+    web3: :class:`Web3`
+        Connected Web3 instance.
+    chain_id: :class:`int`
+        Chain id of the endpoint.
+    gas_fee_cache: :class:`Tuple[float, GasFees]`
+        Monotonic time of the last gas fee fetch and its result.
+    gas_fee_refreshing: :class:`bool`
+        Whether a background gas fee refresh is running.
+    gas_fee_lock: :class:`threading.Lock`
+        Guards gas_fee_refreshing.
+    multicall_available: :class:`bool`
+        Whether Multicall3 is deployed on the endpoint's chain, checked once.
+    references: :class:`int`
+        Number of open nodes using the endpoint. Its connections are closed 
+        when the last one closes.
+    """
+    session: requests.Session
+    web3: Web3
+    chain_id: int
+    gas_fee_cache: Optional[Tuple[float, GasFees]] = None
+    gas_fee_refreshing: bool = False
+    gas_fee_lock: threading.Lock = field(default_factory=threading.Lock)
+    multicall_available: Optional[bool] = None
+    references: int = 0
 
 class Web3Node:
     """
@@ -24,106 +102,497 @@ class Web3Node:
         URL for rpc endpoint.
     retries: :class:`int`
         Optional number of retries for reconnecting to Web3.
+    poll_latency: :class:`float`
+        Optional seconds between receipt polls while verifying.
+    startup_budget_seconds: :class:`float`
+        Optional cap on the total time __init__ may take, independent of 
+        the number of retries. Covers waiting on another node connecting 
+        to the same endpoint, name resolution and the startup RPCs. None 
+        removes the cap.
+    http2: :class:`bool`
+        Optional flag to send RPC calls through HTTP2Provider, which 
+        requires httpx[http2].
+    _endpoints: :class:`Dict[Tuple[str, bool], _EndpointState]`
+        Registry of connected endpoints keyed by (rpc_endpoint, http2), so 
+        nodes on the same endpoint share one connection pool and cache.
+    _connect_locks: :class:`Dict[Tuple[str, bool], threading.Lock]`
+        Per endpoint locks held while connecting, so only nodes waiting on 
+        the same endpoint are held up by a slow connect.
+    _state: :class:`_EndpointState`
+        Shared state of this node's endpoint.
+    _session: :class:`requests.Session`
+        Pooled keep-alive HTTP session of the endpoint, so RPC calls reuse 
+        open TCP/TLS connections.
     _web3: :class:`Web3`
-        Web3 instance responsible for connecting and sending.
+        Web3 instance of the endpoint, responsible for connecting and sending.
+    _local_account: :class:`LocalAccount`
+        Account derived from the private key once, used for signing.
     _account_address: :class:`ChecksumAddress`
         Public address of account.
+    _nonces: :class:`Dict[Tuple[str, ChecksumAddress], NonceState]`
+        Registry of local nonces keyed by (rpc_endpoint, account address), 
+        so every node sending from the account, with or without http2, 
+        reserves from one counter. Entries are dropped when their last 
+        node closes.
+    _nonce_state: :class:`NonceState`
+        Shared nonce of this node's account. Reserved when a transaction 
+        is built, so concurrent sends get contiguous nonces.
+    _template: :class:`Tuple[GasFees, Mapping[str, Any]]`
+        Read-only transfer fields built from the cached gas fees, rebuilt 
+        only when the fees change.
+    _startup_deadline: :class:`float`
+        Monotonic time by which __init__ has to finish.
     """
     _private_key = PRIVATE_KEY
+    _endpoints: ClassVar[Dict[Tuple[str, bool], _EndpointState]] = {}
+    _nonces: ClassVar[Dict[Tuple[str, ChecksumAddress], NonceState]] = {}
+    _connect_locks: ClassVar[Dict[Tuple[str, bool], threading.Lock]] = {}
+    _endpoints_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(
         self, 
         rpc_endpoint: str, 
         retries: Optional[int] = 5,
+        poll_latency: Optional[float] = 1.0,
+        http2: Optional[bool] = False,
+        startup_budget_seconds: Optional[float] = _STARTUP_BUDGET,
     ):
         self.rpc_endpoint: str = rpc_endpoint
         self.retries: Optional[int] = retries
+        self.poll_latency: Optional[float] = poll_latency
+        self.http2: Optional[bool] = http2
+        self.startup_budget_seconds: Optional[float] = startup_budget_seconds
         
+        self._state: Optional[_EndpointState] = None
+        self._session: Optional[requests.Session] = None
         self._web3: Optional[Web3] = None
+        self._local_account: Optional[LocalAccount] = None
         self._account_address: Optional[ChecksumAddress] = None
+        self._nonce_state: Optional[NonceState] = None
+        self._template: Optional[Tuple[GasFees, Mapping[str, Any]]] = None
 
-        self._initialize_web3()
-        self._initialize_account_address()
+        self._startup_deadline: Optional[float] = None
+        if startup_budget_seconds is not None:
+            self._startup_deadline = time.monotonic() + startup_budget_seconds
+        self._start()
     
     def get_gas_fees(
         self
     ) -> GasFees:
-        latest_block = self._web3.eth.get_block('latest')
-        maxPriorityFeePerGas = self._web3.eth.max_priority_fee
+        # Fresh for GAS_FEE_TTL seconds, then served stale while a background 
+        # refresh runs, up to _GAS_FEE_MAX_STALE seconds
+        cache = self._state.gas_fee_cache
+        if cache is not None:
+            fetched_at, gas_fees = cache
+            age = time.monotonic() - fetched_at
+
+            if age < GAS_FEE_TTL:
+                return gas_fees
+            if age < _GAS_FEE_MAX_STALE:
+                self._refresh_gas_fees_in_background()
+                return gas_fees
 
-        base_fee = latest_block['baseFeePerGas']
-        maxFeePerGas = (2 * base_fee) + maxPriorityFeePerGas
+        return self._refresh_gas_fees()
 
-        return GasFees(maxPriorityFeePerGas, maxFeePerGas)
+    def invalidate_gas_fees(self) -> None:
+        self._state.gas_fee_cache = None
     
     def send_ETH(
         self,
         amount: float,
         to_address: str,
     ) -> TransactionResult:
-        to_address = validate_address(to_address)
-        amount_wei = self._web3.to_wei(amount, 'ether')
+        return self.send_ETH_wei(ether_to_wei(amount), to_address)
 
-        tx_data = self.build_transaction_data(**{
-            'to': to_address,
-            'value': amount_wei,
-        })
+    def send_ETH_wei(
+        self,
+        amount_wei: int,
+        to_address: str,
+    ) -> TransactionResult:
+        if not isinstance(amount_wei, int):
+            raise TransactionException("Expected int for amount_wei")
 
-        return self.send_transaction(tx_data)
+        return self.send_transaction(self._build_transfer(amount_wei, to_address))
         
     def build_transaction_data(
         self, 
         **override_parameters: Any
     ) -> Dict[str, Any]:
-        if 'nonce' not in override_parameters:
-            override_parameters['nonce'] = self._web3.eth.get_transaction_count(self._account_address)
-        
-        if 'maxFeePerGas' not in override_parameters or 'maxPriorityFeePerGas' not in override_parameters:
-            gas_params = self.get_gas_fees()
-            
-            if 'maxFeePerGas' not in override_parameters:
-                override_parameters['maxFeePerGas'] = gas_params.maxFeePerGas
-            
-            if 'maxPriorityFeePerGas' not in override_parameters:
-                override_parameters['maxPriorityFeePerGas'] = gas_params.maxPriorityFeePerGas
-        if 'chainId' not in override_parameters:
-            override_parameters['chainId'] = self._web3.eth.chain_id
+        gas_fees = self.get_gas_fees() if needs_gas_fees(override_parameters) else None
+        return validate_transaction_data(override_parameters, gas_fees, self._nonce_state, self._state.chain_id)
+
+    def build_contract_transaction(
+        self, 
+        contract_function: ContractFunction, 
+        **override_parameters: Any
+    ) -> Dict[str, Any]:
+        reserves_nonce = 'nonce' not in override_parameters
+        tx_data = self.build_transaction_data(**override_parameters)
         try:
-            tx_data = TransactionData(**override_parameters).to_dictionary()
-        except ValidationError as e:
-            raise TransactionException(f"Error building transaction: {e}")
-        
-        return tx_data
+            return contract_function.build_transaction(tx_data)
+        except Exception:
+            # Hand the nonce back so a bad call does not leave a gap
+            if reserves_nonce:
+                self._nonce_state.release(tx_data['nonce'])
+            raise
         
     def verify_transaction(
         self, 
         transaction_hash: Union[str, HexBytes], 
         timeout: Optional[int] = 120
     ) -> TransactionStatus:
+        import requests
+        from web3.exceptions import TimeExhausted
+
         try:
-            receipt = self._web3.eth.wait_for_transaction_receipt(transaction_hash, timeout=timeout)
+            receipt = self._web3.eth.wait_for_transaction_receipt(
+                transaction_hash, 
+                timeout=timeout, 
+                poll_latency=self.poll_latency
+            )
             return TransactionStatus(receipt.status)
-        except (TimeExhausted, requests.exceptions, ValueError) as e:
-            print("Error verifying transaction: {}", e)
+        except (TimeExhausted, requests.exceptions.RequestException, ValueError) as e:
+            logger.warning("Error verifying transaction: %s", e)
             return TransactionStatus.NOT_VERIFIED
     
     def send_transaction(
         self, 
         transaction: TxParams
     ) -> TransactionResult:
+        import requests
+        from web3.exceptions import Web3RPCError
+
+        raw_transaction = sign_transaction(self._local_account, transaction, self._nonce_state)
+
+        nonce = transaction.get('nonce')
         try:
-            signed_transaction = self._web3.eth.account.sign_transaction(transaction, self._private_key)
-        except (ValueError, TypeError) as e:
-            raise TransactionException(f"Signing failed: {e}")
-        
-        try:
-            transaction_hash = self._web3.eth.send_raw_transaction(signed_transaction.raw_transaction)
-        except ValueError as e:
+            transaction_hash = self._web3.eth.send_raw_transaction(raw_transaction)
+        except (ValueError, Web3RPCError) as e:
+            if is_underpriced_error(e):
+                self.invalidate_gas_fees()
+            if is_nonce_error(e):
+                self.sync_nonce()
+            else:
+                self._nonce_state.release(nonce)
             raise TransactionException(f"RPC error sending tx: {e}")
         except requests.exceptions.RequestException as e:
+            self._nonce_state.release(nonce)
             raise TransactionException(f"Network error: {e}")
         
-        return TransactionResult(status=self.verify_transaction(transaction_hash), transactionHash=transaction_hash)
+        self._nonce_state.advance(nonce)
+
+        return TransactionResult(
+            status=self.verify_transaction(transaction_hash), 
+            transactionHash=transaction_hash, 
+            rawTransaction=raw_transaction
+        )
+
+    def multicall(
+        self,
+        calls: List[ContractCall],
+        block_identifier: Union[str, int] = 'latest'
+    ) -> List[CallResult]:
+        """Runs read calls in one eth_call through Multicall3 aggregate3."""
+        import requests
+        from eth_abi.exceptions import DecodingError
+        from web3.exceptions import ContractLogicError, Web3RPCError
+
+        if not calls:
+            return []
+
+        if self._state.multicall_available is None:
+            try:
+                code = self._web3.eth.get_code(_MULTICALL3_ADDRESS)
+            except (Web3RPCError, ValueError, requests.exceptions.RequestException) as e:
+                raise MulticallException(f"Multicall3 lookup failed: {e}")
+            self._state.multicall_available = len(code) > 0
+        if not self._state.multicall_available:
+            raise MulticallException(f"Multicall3 is not deployed at {_MULTICALL3_ADDRESS}")
+
+        codec = self._web3.codec
+        call_data = _AGGREGATE3_SELECTOR + codec.encode(
+            ['(address,bool,bytes)[]'],
+            [[(call.target, call.allowFailure, HexBytes(call.callData)) for call in calls]]
+        )
+        try:
+            raw_results = self._web3.eth.call(
+                {'to': _MULTICALL3_ADDRESS, 'data': call_data}, 
+                block_identifier
+            )
+        except (ContractLogicError, Web3RPCError, ValueError, requests.exceptions.RequestException) as e:
+            raise MulticallException(f"Multicall failed: {e}")
+
+        try:
+            (results,) = codec.decode(['(bool,bytes)[]'], raw_results)
+        except DecodingError as e:
+            raise MulticallException(f"Malformed multicall result: {e}")
+        return [CallResult(success, return_data) for success, return_data in results]
+
+    def refresh_chain_id(self) -> int:
+        self._state.chain_id = self._web3.eth.chain_id
+        return self._state.chain_id
+
+    async def send_ETH_many(
+        self,
+        items: List[Tuple[float, str]],
+    ) -> List[Union[TransactionResult, Exception]]:
+        """Sends (amount, to_address) transfers concurrently.
+
+        Nonces are reserved back to back and gas fees come from one fetch, 
+        so every transaction is built locally. Building and signing run in 
+        the default executor and submissions share one aiohttp session. 
+        Returns one entry per item, in order: its TransactionResult, or the 
+        exception that stopped it. A reserved nonce that no transaction 
+        used is handed back if it is the latest, otherwise filled with an 
+        empty transfer to the sender. Transfers queued behind a gap that 
+        could not be filled are reported NOT_VERIFIED without waiting on 
+        their receipts. The nonce is re-synced only if the node reported 
+        a nonce error.
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        # get_gas_fees can block on a refresh, so building stays off the loop
+        results, lost = await loop.run_in_executor(None, self._sign_transfers, items)
+        signed = [index for index, result in enumerate(results) if not isinstance(result, Exception)]
+
+        connector = aiohttp.TCPConnector(limit=_POOL_MAXSIZE)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            transaction_hashes = await asyncio.gather(*(
+                self._submit_raw_transaction(session, index, results[index][1])
+                for index in signed
+            ), return_exceptions=True)
+
+        submitted = []
+        nonce_error = False
+        for index, transaction_hash in zip(signed, transaction_hashes):
+            if not isinstance(transaction_hash, Exception):
+                submitted.append((index, *results[index], transaction_hash))
+                continue
+            if is_nonce_error(transaction_hash):
+                # The nonce is already taken on the node, so it leaves no gap
+                nonce_error = True
+            else:
+                lost.append(results[index][0])
+            results[index] = transaction_hash
+
+        gap = await loop.run_in_executor(None, self._fill_nonce_gaps, lost) if lost else None
+        if nonce_error:
+            await loop.run_in_executor(None, self.sync_nonce)
+
+        if gap is not None:
+            logger.warning("Nonce %d could not be filled, later transfers stay queued behind it", gap)
+        waiting = [item for item in submitted if gap is None or item[1] < gap]
+        statuses = await asyncio.gather(*(
+            loop.run_in_executor(None, self.verify_transaction, transaction_hash)
+            for _, _, _, transaction_hash in waiting
+        ))
+        verified = {index: status for (index, *_), status in zip(waiting, statuses)}
+        for index, _, raw_transaction, transaction_hash in submitted:
+            results[index] = TransactionResult(
+                status=verified.get(index, TransactionStatus.NOT_VERIFIED), 
+                transactionHash=transaction_hash, 
+                rawTransaction=raw_transaction
+            )
+        return results
+
+    def sync_nonce(self) -> int:
+        return self._nonce_state.sync(self._web3.eth.get_transaction_count(self._account_address, 'pending'))
+
+    def resend_transaction(
+        self, 
+        result: TransactionResult
+    ) -> TransactionResult:
+        """
+        Resubmits an unverified transaction as the same signed bytes, so it 
+        keeps its nonce and hash and cannot run twice.
+
+        A node still holding it rejects the copy as already known, one that 
+        dropped it takes it back. The local nonce is left alone, so other 
+        pending transactions keep theirs.
+        """
+        import requests
+        from web3.exceptions import Web3RPCError
+
+        if result.rawTransaction is None:
+            raise TransactionException("No signed transaction to resend")
+        try:
+            self._web3.eth.send_raw_transaction(result.rawTransaction)
+        except (ValueError, Web3RPCError) as e:
+            # Already known while pending, nonce too low once it was mined
+            if not is_nonce_error(e):
+                raise TransactionException(f"RPC error resending tx: {e}")
+        except requests.exceptions.RequestException as e:
+            raise TransactionException(f"Network error: {e}")
+
+        return result._replace(status=self.verify_transaction(result.transactionHash))
+
+    def _template_tx(self) -> Mapping[str, Any]:
+        gas_fees = self.get_gas_fees()
+        if self._template is None or self._template[0] is not gas_fees:
+            self._template = (gas_fees, MappingProxyType({
+                'type': 2,
+                'chainId': self._state.chain_id,
+                'maxFeePerGas': gas_fees.maxFeePerGas,
+                'maxPriorityFeePerGas': gas_fees.maxPriorityFeePerGas,
+                'gas': _DEFAULT_GAS,
+            }))
+        return self._template[1]
+
+    def _build_transfer(
+        self,
+        amount_wei: int,
+        to_address: str
+    ) -> Dict[str, Any]:
+        if amount_wei < 0:
+            raise TransactionException(f"Transfer amount must not be negative: {amount_wei}")
+
+        # Every field is already typed, so transfers skip TransactionData validation
+        return {
+            **self._template_tx(),
+            'to': address_to_bytes(to_address),
+            'value': amount_wei,
+            'nonce': self._nonce_state.reserve(),
+        }
+
+    def _sign_transfers(
+        self,
+        items: List[Tuple[float, str]]
+    ) -> Tuple[List[Union[Tuple[int, bytes], Exception]], List[int]]:
+        signed: List[Union[Tuple[int, bytes], Exception]] = []
+        lost: List[int] = []
+        for amount, to_address in items:
+            # A failed build never reaches the nonce reservation
+            try:
+                transaction = self._build_transfer(ether_to_wei(amount), to_address)
+            except (TransactionException, InvalidAddressException, ValueError, OverflowError) as e:
+                signed.append(e)
+                continue
+
+            nonce = transaction['nonce']
+            try:
+                signed.append((nonce, sign_transaction(self._local_account, transaction, None)))
+            except TransactionException as e:
+                if not self._nonce_state.release(nonce):
+                    lost.append(nonce)
+                signed.append(e)
+        return signed, lost
+
+    def _fill_nonce_gaps(
+        self,
+        lost: List[int]
+    ) -> Optional[int]:
+        import requests
+        from web3.exceptions import Web3RPCError
+
+        # Highest first, so a run of lost nonces at the top is handed back whole
+        gap = None
+        for nonce in sorted(lost, reverse=True):
+            if self._nonce_state.release(nonce):
+                continue
+            try:
+                raw_transaction = sign_transaction(self._local_account, {
+                    **self._template_tx(),
+                    'to': address_to_bytes(self._account_address),
+                    'value': 0,
+                    'nonce': nonce,
+                }, None)
+                self._web3.eth.send_raw_transaction(raw_transaction)
+            except (ValueError, Web3RPCError) as e:
+                # The original transaction may have reached the node after all
+                if not is_nonce_error(e):
+                    logger.warning("Filling nonce %d failed: %s", nonce, e)
+                    gap = nonce
+            except (TransactionException, requests.exceptions.RequestException) as e:
+                logger.warning("Filling nonce %d failed: %s", nonce, e)
+                gap = nonce
+        return gap
+
+    async def _submit_raw_transaction(
+        self,
+        session: aiohttp.ClientSession,
+        request_id: int,
+        raw_transaction: bytes
+    ) -> HexBytes:
+        import aiohttp
+
+        payload = {
+            'jsonrpc': '2.0',
+            'method': 'eth_sendRawTransaction',
+            'params': [HexBytes(raw_transaction).to_0x_hex()],
+            'id': request_id,
+        }
+        try:
+            async with session.post(self.rpc_endpoint, json=payload) as response:
+                body = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise TransactionException(f"Network error: {e}")
+
+        if 'error' in body:
+            if is_underpriced_error(body['error']):
+                self.invalidate_gas_fees()
+            raise TransactionException(f"RPC error sending tx: {body['error']}")
+        return HexBytes(body['result'])
+
+    def _refresh_gas_fees(self) -> GasFees:
+        gas_fees = self._batch_prepare_tx_params()
+
+        self._state.gas_fee_cache = (time.monotonic(), gas_fees)
+        return gas_fees
+
+    def _refresh_gas_fees_in_background(self) -> None:
+        with self._state.gas_fee_lock:
+            if self._state.gas_fee_refreshing:
+                return
+            self._state.gas_fee_refreshing = True
+
+        def refresh() -> None:
+            try:
+                self._refresh_gas_fees()
+            except Exception as e:
+                logger.warning("Background gas fee refresh failed: %s", e)
+            finally:
+                self._state.gas_fee_refreshing = False
+
+        threading.Thread(target=refresh, name="gas-fee-refresh", daemon=True).start()
+
+    def _batch_prepare_tx_params(self) -> GasFees:
+        # One JSON-RPC batch instead of a round trip per value
+        with self._web3.batch_requests() as batch:
+            batch.add(self._web3.eth.fee_history(1, 'latest'))
+            batch.add(self._web3.eth.max_priority_fee)
+            fee_history, maxPriorityFeePerGas = batch.execute()
+
+        # The last entry is the base fee of the block after 'latest'
+        base_fee = fee_history['baseFeePerGas'][-1]
+        return GasFees(maxPriorityFeePerGas, (2 * base_fee) + maxPriorityFeePerGas)
+
+    def close(self) -> None:
+        """
+        Detaches this node from its endpoint. The shared connections are 
+        closed once no other node uses them.
+        """
+        state = self._state
+        if state is None:
+            return
+        self._state = None
+        self._session = None
+        self._web3 = None
+
+        with Web3Node._endpoints_lock:
+            if self._nonce_state is not None:
+                self._nonce_state.references -= 1
+                if self._nonce_state.references == 0 and Web3Node._nonces.get(self._nonce_key()) is self._nonce_state:
+                    del Web3Node._nonces[self._nonce_key()]
+
+            state.references -= 1
+            if state.references > 0:
+                return
+            if Web3Node._endpoints.get(self._endpoint_key()) is state:
+                del Web3Node._endpoints[self._endpoint_key()]
+
+        _close_connections(state.session, state.web3)
 
     def get_web3(self) -> Web3:
         return self._web3
@@ -131,30 +600,172 @@ class Web3Node:
     def get_address(self) -> ChecksumAddress:
         return self._account_address
         
+    def _endpoint_key(self) -> Tuple[str, bool]:
+        return self.rpc_endpoint, bool(self.http2)
+
+    def _nonce_key(self) -> Tuple[str, ChecksumAddress]:
+        return self.rpc_endpoint, self._account_address
+
+    def _start(self) -> None:
+        import requests
+        from .providers import request_deadline
+
+        # Every startup RPC is capped at the time left in the budget
+        with request_deadline(self._startup_deadline):
+            self._initialize_endpoint()
+            try:
+                self._initialize_account_address()
+            except requests.exceptions.RequestException as e:
+                self.close()
+                raise Web3ConnectionException(f"Unable to fetch the account nonce: {e}")
+            except BaseException:
+                self.close()
+                raise
+
+    def _startup_time_left(self) -> Optional[float]:
+        if self._startup_deadline is None:
+            return None
+        return max(self._startup_deadline - time.monotonic(), 0.0)
+
+    def _initialize_endpoint(self) -> None:
+        key = self._endpoint_key()
+        # _endpoints_lock only guards the registries and is never held across RPCs
+        with Web3Node._endpoints_lock:
+            connect_lock = Web3Node._connect_locks.setdefault(key, threading.Lock())
+
+        time_left = self._startup_time_left()
+        if not connect_lock.acquire(timeout=-1 if time_left is None else time_left):
+            raise Web3ConnectionException(f"Timed out waiting for another node connecting to {self.rpc_endpoint}")
+        try:
+            with Web3Node._endpoints_lock:
+                state = Web3Node._endpoints.get(key)
+                if state is not None:
+                    state.references += 1
+
+            if state is None:
+                state = self._connect()
+                with Web3Node._endpoints_lock:
+                    Web3Node._endpoints[key] = state
+                    state.references += 1
+        finally:
+            connect_lock.release()
+
+        self._state = state
+        self._session = state.session
+        self._web3 = state.web3
+
+    def _connect(self) -> _EndpointState:
+        import requests
+
+        self._initialize_session()
+        try:
+            self._initialize_web3()
+            try:
+                chain_id = self._web3.eth.chain_id
+            except requests.exceptions.RequestException as e:
+                raise Web3ConnectionException(f"Unable to fetch the chain id: {e}")
+            return _EndpointState(session=self._session, web3=self._web3, chain_id=chain_id)
+        except BaseException:
+            _close_connections(self._session, self._web3)
+            self._session = None
+            self._web3 = None
+            raise
+
+    def _initialize_session(self) -> None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE, max_retries=0)
+
+        self._session = requests.Session()
+        self._session.headers['Connection'] = 'keep-alive'
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def _create_provider(self) -> JSONBaseProvider:
+        from .providers import BoundedHTTPProvider, HTTP2Provider
+
+        if self.http2:
+            return HTTP2Provider(self.rpc_endpoint, timeout=REQUEST_TIMEOUT)
+        return BoundedHTTPProvider(
+            self.rpc_endpoint, 
+            session=self._session, 
+            request_kwargs={'timeout': REQUEST_TIMEOUT}
+        )
+
     def _initialize_web3(self) -> None:
+        from web3 import Web3
+
+        self._web3 = Web3(self._create_provider())
 
-        self._web3 = Web3(Web3.HTTPProvider(self.rpc_endpoint))
+        started = time.monotonic()
+        deadline = self._startup_deadline
         
         retried = 0
-        while not self._web3.is_connected() and retried != self.retries:
-            print("Web3 connection failed. Retrying..")
-            time.sleep(1)
+        # The provider's timeout is capped by the startup deadline, so a probe never outlasts it
+        while not self._web3.is_connected():
+            now = time.monotonic()
+            if retried == self.retries or (deadline is not None and now >= deadline):
+                raise Web3ConnectionException(
+                    f"Unable to connect to RPC endpoint after {retried + 1} attempts "
+                    f"in {now - started:.2f}s"
+                )
+            if self._is_unresolvable():
+                raise Web3ConnectionException(f"Unable to resolve RPC endpoint {self.rpc_endpoint}")
+
+            delay = connect_delay(retried)
+            if deadline is not None:
+                delay = min(delay, max(deadline - time.monotonic(), 0.0))
             retried += 1
+            logger.warning(
+                "Web3 connection failed (attempt %d of %s). Retrying in %.2fs..", 
+                retried, self.retries, delay
+            )
+            time.sleep(delay)
+        
+    def _is_unresolvable(self) -> bool:
+        host = urlparse(self.rpc_endpoint).hostname
+        if host is None:
+            return False
+        # getaddrinfo has no timeout of its own, so it runs in a daemon thread 
+        # and an unfinished lookup is left to the startup deadline
+        errors: List[socket.gaierror] = []
 
-            self._web3 = Web3(Web3.HTTPProvider(self.rpc_endpoint))
+        def resolve() -> None:
+            try:
+                socket.getaddrinfo(host, None)
+            except socket.gaierror as e:
+                errors.append(e)
+
+        resolver = threading.Thread(target=resolve, name="resolve-endpoint", daemon=True)
+        resolver.start()
+        resolver.join(self._startup_time_left())
+        if resolver.is_alive() or not errors:
+            return False
+        # Only a missing name is permanent, temporary lookup failures are retried
+        return errors[0].errno == socket.EAI_NONAME
 
-        if not self._web3.is_connected():
-            raise Web3ConnectionException("Unable to connect to RPC endpoint")
-        
-    def _validate_key(self) -> Account:
-        try:
-            return Account.from_key(self._private_key)
-        except (ValueError, TypeError) as e:
-            raise InvalidPrivateKeyException(f"Environment private key is invalid: {e}")
-    
     def _initialize_account_address(self) -> None:
-        account = self._validate_key()
-        self._account_address = account.address
+        self._local_account = load_account(self._private_key)
+        self._account_address = self._local_account.address
+
+        with Web3Node._endpoints_lock:
+            self._nonce_state = Web3Node._nonces.setdefault(self._nonce_key(), NonceState())
+            self._nonce_state.references += 1
+
+        # Only the first node for the account needs to fetch the nonce
+        if self._nonce_state.nonce is None:
+            self.sync_nonce()
+
+def _close_connections(
+    session: requests.Session,
+    web3: Optional[Web3]
+) -> None:
+    from .providers import HTTP2Provider
+
+    if web3 is not None and isinstance(web3.provider, HTTP2Provider):
+        web3.provider.close()
+    session.close()
 
 def validate_web3_node(
     _web3_node: Web3Node